@@ -17,6 +17,7 @@ Token格式：[种别码, 词素值, 行号, 列号]
 """
 
 import re
+import sys
 from typing import Iterator, List, Tuple
 
 # Token类型定义：包含种别码、词素值、行号、列号四个元素
@@ -54,6 +55,11 @@ TOK_REGEX = re.compile("|".join(f"(?P<{name}>{pat})" for name, pat in TOKEN_SPEC
 # 这些词在SQL中有特殊含义，不是普通标识符
 KEYWORDS = {"select", "from", "where", "insert", "into", "values", "create", "table", "delete", "int", "varchar"}
 
+# 关键字大写形式 -> 驻留(intern)后的种别码
+# 同一关键字的所有Token共享同一个字符串对象，语法分析器中的
+# tok[0] == "SELECT" 之类比较可走指针相等的快速路径
+_KEYWORD_KINDS = {k.upper(): sys.intern(k.upper()) for k in KEYWORDS}
+
 
 class LexError(Exception):
     """
@@ -68,26 +74,22 @@ class LexError(Exception):
         self.col = col    # 错误所在列号
 
 
-def tokenize(sql: str) -> List[Token]:
+def iter_tokens(sql: str) -> Iterator[Token]:
     """
-    词法分析主函数
+    按需产生Token的词法分析生成器
     
-    将SQL源代码字符串分解为Token序列。
+    逐个产生Token而不先构造完整列表，适合只需顺序遍历一次的场景
+    （如调试输出、超长脚本的流式处理）。非法字符在扫描到时才抛出LexError。
     
     参数:
         sql (str): 输入的SQL源代码字符串
         
     返回:
-        List[Token]: Token列表，每个Token包含[种别码, 词素值, 行号, 列号]
+        Iterator[Token]: Token迭代器，每个Token包含[种别码, 词素值, 行号, 列号]
         
     异常:
         LexError: 当遇到无法识别的字符时抛出
-        
-    示例:
-        >>> tokens = tokenize("SELECT * FROM users;")
-        >>> print(tokens[0])  # ('SELECT', 'SELECT', 1, 1)
     """
-    tokens: List[Token] = []  # 存储解析出的Token
     line = 1                  # 当前行号
     col = 1                   # 当前列号
     i = 0                     # 当前字符位置
@@ -120,19 +122,47 @@ def tokenize(sql: str) -> List[Token]:
         # 移动到下一个字符位置
         i = m.end()
         
-        # 跳过空白字符（不加入Token列表）
+        # 跳过空白字符（不产生Token）
         if kind == "WS":
             continue
         
         # 处理标识符：检查是否为关键字
-        if kind == "IDENT" and text.lower() in KEYWORDS:
-            # 如果是关键字，种别码使用大写形式
-            tokens.append((text.upper(), text, line, start_col))
+        if kind == "IDENT":
+            # 已是大写的关键字（SQL中最常见）直接复用，避免upper()再分配一个字符串
+            up = text if text.isupper() else text.upper()
+            kw = _KEYWORD_KINDS.get(up)
+            if kw is not None:
+                # 如果是关键字，种别码使用驻留的大写形式
+                yield (kw, text, line, start_col)
+            else:
+                # 表名/列名驻留：同一标识符在AST、目录和行字典中共享同一字符串对象，
+                # 字典查找时可直接按指针命中
+                yield ("IDENT", sys.intern(text), line, start_col)
         elif kind == "STRING":
             # 处理字符串：去掉首尾的单引号
-            tokens.append(("STRING", text[1:-1], line, start_col))
+            yield ("STRING", text[1:-1], line, start_col)
         else:
-            # 其他词法单元：种别码使用大写形式
-            tokens.append((kind.upper(), text, line, start_col))
+            # 其他词法单元：组名在TOKEN_SPEC中已是大写，可直接作为种别码
+            yield (kind, text, line, start_col)
+
+
+def tokenize(sql: str) -> List[Token]:
+    """
+    词法分析主函数
     
-    return tokens
+    将SQL源代码字符串分解为Token序列。
+    
+    参数:
+        sql (str): 输入的SQL源代码字符串
+        
+    返回:
+        List[Token]: Token列表，每个Token包含[种别码, 词素值, 行号, 列号]
+        
+    异常:
+        LexError: 当遇到无法识别的字符时抛出
+        
+    示例:
+        >>> tokens = tokenize("SELECT * FROM users;")
+        >>> print(tokens[0])  # ('SELECT', 'SELECT', 1, 1)
+    """
+    return list(iter_tokens(sql))
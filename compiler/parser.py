@@ -15,7 +15,8 @@
 解析方法：递归下降分析法
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import functools
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .lexer import tokenize, Token
 
@@ -26,8 +27,9 @@ class AST:
     
     所有SQL语句的AST节点都继承自此类。
     AST是源代码的树形表示，便于后续的语义分析和代码生成。
+    节点类均声明 __slots__，不为每个实例分配 __dict__。
     """
-    pass
+    __slots__ = ()
 
 
 class Select(AST):
@@ -39,6 +41,8 @@ class Select(AST):
     - table: 要查询的表名
     - where: WHERE条件（可选），格式为(列名, 操作符, 值)
     """
+    __slots__ = ("columns", "table", "where")
+
     def __init__(self, columns: List[str], table: str, where: Optional[Tuple[str, str, Any]] = None) -> None:
         self.columns = columns  # 列名列表，如["id", "name"]或["*"]
         self.table = table     # 表名
@@ -52,12 +56,17 @@ class Insert(AST):
     表示一个INSERT插入语句，包含：
     - table: 目标表名
     - columns: 要插入的列名列表
-    - values: 对应的值列表
+    - values: 对应的值列表（第一行）
+    - rows: 所有值行，VALUES (...), (...) 多行插入时包含多行
     """
-    def __init__(self, table: str, columns: List[str], values: List[Any]) -> None:
+    __slots__ = ("table", "columns", "values", "rows")
+
+    def __init__(self, table: str, columns: List[str], values: List[Any],
+                 rows: Optional[List[List[Any]]] = None) -> None:
         self.table = table    # 目标表名
         self.columns = columns  # 列名列表
         self.values = values    # 值列表，与columns一一对应
+        self.rows = rows if rows is not None else [values]  # 所有值行
 
 
 class CreateTable(AST):
@@ -68,6 +77,8 @@ class CreateTable(AST):
     - table: 要创建的表名
     - columns: 列定义列表，每个元素为(列名, 类型)
     """
+    __slots__ = ("table", "columns")
+
     def __init__(self, table: str, columns: List[Tuple[str, str]]) -> None:
         self.table = table    # 表名
         self.columns = columns  # 列定义列表：[(列名, 类型), ...]，类型为"INT"或"VARCHAR"
@@ -81,11 +92,45 @@ class Delete(AST):
     - table: 目标表名
     - where: WHERE条件（可选），格式为(列名, 操作符, 值)
     """
+    __slots__ = ("table", "where")
+
     def __init__(self, table: str, where: Optional[Tuple[str, str, Any]]) -> None:
         self.table = table  # 目标表名
         self.where = where  # WHERE条件：(列名, 操作符, 值)
 
 
+# 追加在Token序列末尾的EOF哨兵
+_EOF_TOKEN: Token = ("EOF", "", 0, 0)
+
+
+def _number_value(text: str) -> Any:
+    """数字字面量取值：整数转换为int，否则转换为float"""
+    return int(text) if text.isdigit() else float(text)
+
+
+# WHERE子句支持的比较运算符种别码
+_COMPARISON_OPS = frozenset({"EQ", "NE", "GT", "LT", "GE", "LE"})
+
+# 支持的列类型
+_COLUMN_TYPES = frozenset({"INT", "VARCHAR"})
+
+# 字面量Token种别码 -> 取值函数
+# 按种别码一次查表，代替逐个比较STRING/NUMBER的分支
+_LITERAL_VALUE: Dict[str, Callable[[str], Any]] = {
+    "STRING": str,           # 字符串值（词法阶段已去掉引号）
+    "NUMBER": _number_value,
+}
+
+
+def is_select_star(columns: List[str]) -> bool:
+    """
+    判断SELECT的列名列表是否为通配符 *
+    
+    代替 columns == ["*"] 的写法，避免每次比较都临时构造一个列表。
+    """
+    return len(columns) == 1 and columns[0] == "*"
+
+
 class Parser:
     """
     语法分析器主类
@@ -95,6 +140,16 @@ class Parser:
     为每个语法规则编写一个对应的解析函数。
     """
     
+    __slots__ = ("tokens", "kinds", "pos")
+    
+    # 语句首关键字 -> 解析方法名，parse() 据此分派
+    _STMT_DISPATCH: Dict[str, str] = {
+        "SELECT": "_parse_select",
+        "INSERT": "_parse_insert",
+        "CREATE": "_parse_create_table",
+        "DELETE": "_parse_delete",
+    }
+    
     def __init__(self, sql: str) -> None:
         """
         初始化语法分析器
@@ -103,18 +158,29 @@ class Parser:
             sql (str): 要解析的SQL源代码字符串
         """
         self.tokens = tokenize(sql)  # 调用词法分析器生成Token序列
+        # 末尾追加EOF哨兵：任何位置的读取都合法，无需再做越界判断
+        self.tokens.append(_EOF_TOKEN)
+        # 与tokens平行的种别码列表：热路径上的类型判断只需一次下标访问
+        self.kinds: List[str] = [t[0] for t in self.tokens]
         self.pos = 0                 # 当前Token位置指针
 
-    def _peek(self) -> Optional[Token]:
+    def _peek(self) -> Token:
         """
         查看当前Token但不消费（不移动位置指针）
         
         返回:
-            Optional[Token]: 当前Token，如果已到末尾则返回None
+            Token: 当前Token，如果已到末尾则返回EOF哨兵
         """
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
-        return None
+        return self.tokens[self.pos]
+
+    def _peek_kind(self) -> str:
+        """
+        查看当前Token的种别码，已到末尾时为"EOF"
+        
+        返回:
+            str: 当前Token的种别码
+        """
+        return self.kinds[self.pos]
 
     def _eat(self, kind: str) -> Token:
         """
@@ -131,11 +197,12 @@ class Parser:
         异常:
             SyntaxError: 当Token类型不匹配时抛出
         """
-        tok = self._peek()
-        if tok is None or tok[0] != kind:
+        # 直接按下标读取种别码，省去一次 _peek() 方法调用
+        pos = self.pos
+        if self.kinds[pos] != kind:
             raise SyntaxError(self._expect_msg(kind))
-        self.pos += 1
-        return tok
+        self.pos = pos + 1
+        return self.tokens[pos]
 
     def _expect_msg(self, kind: str) -> str:
         """
@@ -148,7 +215,7 @@ class Parser:
             str: 格式化的错误消息
         """
         tok = self._peek()
-        if tok is None:
+        if tok[0] == "EOF":
             return f"Expected {kind}, got EOF"
         t, lex, line, col = tok
         return f"Expected {kind}, got {t}('{lex}') at {line}:{col}"
@@ -162,11 +229,11 @@ class Parser:
         """
         asts: List[AST] = []
         # 循环解析直到所有Token都被消费
-        while self.pos < len(self.tokens):
+        while self._peek_kind() != "EOF":
             asts.append(self.parse())  # 解析一条语句
             # 如果下一条是分号，消费它
-            if self._peek() and self._peek()[0] == "SEMI":
-                self._eat("SEMI")
+            if self._peek_kind() == "SEMI":
+                self.pos += 1
         return asts
 
     def parse(self) -> AST:
@@ -182,20 +249,39 @@ class Parser:
             SyntaxError: 当遇到不支持的语句类型时抛出
         """
         tok = self._peek()
-        if tok is None:
+        if tok[0] == "EOF":
             raise SyntaxError("empty input")
         
-        # 根据语句类型选择相应的解析函数
-        if tok[0] == "SELECT":
-            return self._parse_select()
-        if tok[0] == "INSERT":
-            return self._parse_insert()
-        if tok[0] == "CREATE":
-            return self._parse_create_table()
-        if tok[0] == "DELETE":
-            return self._parse_delete()
+        # 根据语句类型选择相应的解析函数：一次字典查找代替逐个比较
+        handler = self._STMT_DISPATCH.get(tok[0])
+        if handler is None:
+            raise SyntaxError(f"unsupported statement {tok}")
+        return getattr(self, handler)()
+
+    def _parse_comma_list(self, parse_item: Callable[[], Any]) -> List[Any]:
+        """
+        解析以逗号分隔的列表：项 {, 项}
+        
+        SELECT列名、INSERT列名/值行、CREATE TABLE列定义共用此循环。
         
-        raise SyntaxError(f"unsupported statement {tok}")
+        参数:
+            parse_item (Callable[[], Any]): 解析单个列表项的方法
+            
+        返回:
+            List[Any]: 各列表项的解析结果
+        """
+        items = [parse_item()]
+        kinds = self.kinds
+        while kinds[self.pos] == "COMMA":
+            self.pos += 1  # 消费逗号
+            items.append(parse_item())
+        return items
+
+    def _parse_ident(self) -> str:
+        """
+        解析一个标识符，返回其词素
+        """
+        return self._eat("IDENT")[1]
 
     def _parse_where_clause(self) -> Optional[Tuple[str, str, Any]]:
         """
@@ -208,37 +294,35 @@ class Parser:
             Optional[Tuple[str, str, Any]]: WHERE条件元组(列名, 操作符, 值)，
                                            如果没有WHERE子句则返回None
         """
-        tok = self._peek()
-        if tok and tok[0] == "WHERE":
-            self._eat("WHERE")  # 消费WHERE关键字
+        # 种别码列表与位置指针读入局部变量，只在前进时写回 self.pos
+        kinds = self.kinds
+        pos = self.pos
+        if kinds[pos] == "WHERE":
+            pos += 1  # 消费WHERE关键字
             
             # 解析列名
-            col = self._eat("IDENT")[1]
+            if kinds[pos] != "IDENT":
+                self.pos = pos
+                raise SyntaxError(self._expect_msg("IDENT"))
+            col = self.tokens[pos][1]
+            pos += 1
             
             # 解析比较操作符
-            op_tok = self._peek()
-            if op_tok is None:
+            self.pos = pos
+            op = kinds[pos]
+            if op == "EOF":
                 raise SyntaxError(self._expect_msg("comparison operator"))
-            op = op_tok[0]
-            if op not in ("EQ", "NE", "GT", "LT", "GE", "LE"):
+            if op not in _COMPARISON_OPS:
                 raise SyntaxError(self._expect_msg("comparison operator (=,<> ,!=, >, <, >=, <=)"))
-            self.pos += 1
+            pos += 1
             
             # 解析值（字符串或数字）
-            val_tok = self._peek()
-            if val_tok is None:
-                raise SyntaxError(self._expect_msg("literal value"))
-            
-            if val_tok[0] == "STRING":
-                val = val_tok[1]  # 字符串值
-                self.pos += 1
-            elif val_tok[0] == "NUMBER":
-                text = val_tok[1]
-                # 尝试转换为整数，失败则转换为浮点数
-                val = int(text) if isinstance(text, str) and text.isdigit() else float(text)
-                self.pos += 1
-            else:
+            self.pos = pos
+            to_value = _LITERAL_VALUE.get(kinds[pos])
+            if to_value is None:
                 raise SyntaxError(self._expect_msg("literal value"))
+            val = to_value(self.tokens[pos][1])
+            self.pos = pos + 1
             
             return (col, op, val)
         return None
@@ -253,25 +337,17 @@ class Parser:
         返回:
             Select: SELECT语句的AST节点
         """
-        self._eat("SELECT")  # 消费SELECT关键字
+        self.pos += 1  # 消费SELECT关键字（parse() 分派时已确认）
         
         # 解析列名列表
-        cols: List[str] = []
-        tok = self._peek()
-        if tok and tok[0] == "STAR":
+        cols: List[str]
+        if self._peek_kind() == "STAR":
             # SELECT * 的情况
             self._eat("STAR")
             cols = ["*"]
         else:
             # SELECT 列名1, 列名2, ... 的情况
-            while True:
-                ident = self._eat("IDENT")[1]
-                cols.append(ident)
-                tok = self._peek()
-                if tok and tok[0] == "COMMA":
-                    self._eat("COMMA")  # 消费逗号
-                    continue
-                break
+            cols = self._parse_comma_list(self._parse_ident)
         
         self._eat("FROM")  # 消费FROM关键字
         table = self._eat("IDENT")[1]  # 解析表名
@@ -286,55 +362,57 @@ class Parser:
         解析INSERT语句
         
         INSERT语句格式：
-        INSERT INTO 表名(列名列表) VALUES(值列表)
+        INSERT INTO 表名(列名列表) VALUES(值列表) [, (值列表) ...]
         
         返回:
             Insert: INSERT语句的AST节点
         """
-        self._eat("INSERT")  # 消费INSERT关键字
+        self.pos += 1  # 消费INSERT关键字（parse() 分派时已确认）
         self._eat("INTO")    # 消费INTO关键字
         table = self._eat("IDENT")[1]  # 解析表名
         
         # 解析列名列表
         self._eat("LPAREN")  # 消费左括号
-        columns: List[str] = []
-        while True:
-            columns.append(self._eat("IDENT")[1])
-            tok = self._peek()
-            if tok and tok[0] == "COMMA":
-                self._eat("COMMA")
-                continue
-            break
+        columns: List[str] = self._parse_comma_list(self._parse_ident)
         self._eat("RPAREN")  # 消费右括号
         
-        # 解析值列表
+        # 解析值行列表（支持多行）
         self._eat("VALUES")  # 消费VALUES关键字
+        rows: List[List[Any]] = self._parse_comma_list(self._parse_value_row)
+        
+        return Insert(table, columns, rows[0], rows)
+
+    def _parse_value_row(self) -> List[Any]:
+        """
+        解析VALUES中的一行：(值, 值, ...)
+        
+        返回:
+            List[Any]: 该行的值列表
+        """
         self._eat("LPAREN")  # 消费左括号
+        
+        # 批量插入时这是最热的循环：字面量在此直接取值，
+        # 不再为每个值调用一次解析方法
+        kinds = self.kinds
+        tokens = self.tokens
+        pos = self.pos
         values: List[Any] = []
         while True:
-            tok = self._peek()
-            if tok is None:
-                raise SyntaxError(self._expect_msg("value in VALUES"))
-            
-            if tok[0] == "STRING":
-                values.append(tok[1])  # 字符串值
-                self.pos += 1
-            elif tok[0] == "NUMBER":
-                text = tok[1]
-                # 尝试转换为整数，失败则转换为浮点数
-                values.append(int(text) if isinstance(text, str) and text.isdigit() else float(text))
-                self.pos += 1
-            else:
+            to_value = _LITERAL_VALUE.get(kinds[pos])
+            if to_value is None:
+                self.pos = pos
+                if kinds[pos] == "EOF":
+                    raise SyntaxError(self._expect_msg("value in VALUES"))
                 raise SyntaxError(self._expect_msg("literal value in VALUES"))
-            
-            tok = self._peek()
-            if tok and tok[0] == "COMMA":
-                self._eat("COMMA")
-                continue
-            break
-        self._eat("RPAREN")  # 消费右括号
+            values.append(to_value(tokens[pos][1]))
+            pos += 1
+            if kinds[pos] != "COMMA":
+                break
+            pos += 1  # 消费逗号
+        self.pos = pos
         
-        return Insert(table, columns, values)
+        self._eat("RPAREN")  # 消费右括号
+        return values
 
     def _parse_create_table(self) -> CreateTable:
         """
@@ -347,47 +425,47 @@ class Parser:
         返回:
             CreateTable: CREATE TABLE语句的AST节点
         """
-        self._eat("CREATE")  # 消费CREATE关键字
+        self.pos += 1  # 消费CREATE关键字（parse() 分派时已确认）
         self._eat("TABLE")  # 消费TABLE关键字
         table = self._eat("IDENT")[1]  # 解析表名
         
         # 解析列定义列表
         self._eat("LPAREN")  # 消费左括号
-        cols: List[Tuple[str, str]] = []
-        while True:
-            name = self._eat("IDENT")[1]  # 解析列名
-            
-            # 解析列类型
-            typ_tok = self._peek()
-            if typ_tok is None:
-                raise SyntaxError(self._expect_msg("type (INT or VARCHAR)"))
-            
-            if typ_tok[0] in ("INT", "VARCHAR"):
-                # 类型是关键字
-                typ_name = typ_tok[0]
-                self.pos += 1
-            elif typ_tok[0] == "IDENT":
-                # 类型是标识符
-                typ_name = typ_tok[1].upper()
-                self.pos += 1
-            else:
-                raise SyntaxError(self._expect_msg("type (INT or VARCHAR)"))
-            
-            # 检查类型是否支持
-            if typ_name not in ("INT", "VARCHAR"):
-                raise SyntaxError(f"unsupported type {typ_name}")
-            
-            cols.append((name, typ_name))
-            
-            tok = self._peek()
-            if tok and tok[0] == "COMMA":
-                self._eat("COMMA")
-                continue
-            break
+        cols: List[Tuple[str, str]] = self._parse_comma_list(self._parse_column_def)
         self._eat("RPAREN")  # 消费右括号
         
         return CreateTable(table, cols)
 
+    def _parse_column_def(self) -> Tuple[str, str]:
+        """
+        解析一个列定义
+        
+        列定义格式：列名 类型
+        
+        返回:
+            Tuple[str, str]: (列名, 类型)
+        """
+        name = self._eat("IDENT")[1]  # 解析列名
+        
+        # 解析列类型
+        typ_kind, typ_lex, _, _ = self.tokens[self.pos]
+        if typ_kind in _COLUMN_TYPES:
+            # 类型是关键字
+            typ_name = typ_kind
+        elif typ_kind == "IDENT":
+            # 类型是标识符
+            typ_name = typ_lex.upper()
+        else:
+            # 包括已到末尾（EOF）的情况
+            raise SyntaxError(self._expect_msg("type (INT or VARCHAR)"))
+        self.pos += 1
+        
+        # 检查类型是否支持
+        if typ_name not in _COLUMN_TYPES:
+            raise SyntaxError(f"unsupported type {typ_name}")
+        
+        return (name, typ_name)
+
     def _parse_delete(self) -> Delete:
         """
         解析DELETE语句
@@ -398,7 +476,7 @@ class Parser:
         返回:
             Delete: DELETE语句的AST节点
         """
-        self._eat("DELETE")  # 消费DELETE关键字
+        self.pos += 1  # 消费DELETE关键字（parse() 分派时已确认）
         self._eat("FROM")    # 消费FROM关键字
         table = self._eat("IDENT")[1]  # 解析表名
         
@@ -406,3 +484,25 @@ class Parser:
         where = self._parse_where_clause()
         
         return Delete(table, where)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_many_cached(sql: str) -> Tuple[AST, ...]:
+    """按SQL原文缓存 parse_many 的结果（以元组保存，防止被调用方修改）"""
+    return tuple(Parser(sql).parse_many())
+
+
+def parse_sql_cached(sql: str) -> List[AST]:
+    """
+    带缓存的多语句解析
+    
+    相同的SQL文本只做一次词法和语法分析，重复执行时直接命中LRU缓存。
+    返回的列表是新建的，但其中的AST节点在各次调用间共享，调用方应只读使用。
+    
+    参数:
+        sql (str): SQL源代码字符串
+        
+    返回:
+        List[AST]: AST节点列表
+    """
+    return list(_parse_many_cached(sql))
@@ -22,6 +22,7 @@
 
 from typing import Any, Dict, List, Optional
 
+from compiler.parser import is_select_star
 from execution.executor import Executor
 from execution.operators import (
     SeqScan, Filter, Project, Insert as OpInsert, Operator, 
@@ -37,6 +38,14 @@ class Planner:
     查询规划器是连接高级SQL语言和底层执行引擎的桥梁。
     """
     
+    # 操作类型 -> 规划方法名，plan() 据此分派
+    _PLAN_DISPATCH: Dict[str, str] = {
+        "select": "_plan_select",
+        "insert": "_plan_insert",
+        "create_table": "_plan_create_table",
+        "delete": "_plan_delete",
+    }
+    
     def __init__(self, executor: Executor) -> None:
         """
         初始化查询规划器
@@ -61,20 +70,11 @@ class Planner:
         异常:
             ValueError: 当遇到不支持的操作类型时抛出
         """
-        kind = analyzed.kind      # 操作类型
-        payload = analyzed.payload  # 操作信息
-        
-        # 根据操作类型生成相应的执行计划
-        if kind == "select":
-            return self._plan_select(payload)
-        elif kind == "insert":
-            return self._plan_insert(payload)
-        elif kind == "create_table":
-            return self._plan_create_table(payload)
-        elif kind == "delete":
-            return self._plan_delete(payload)
-        else:
+        # 根据操作类型查表选择相应的规划方法
+        handler = self._PLAN_DISPATCH.get(analyzed.kind)
+        if handler is None:
             raise ValueError("unsupported analyzed plan kind")
+        return getattr(self, handler)(analyzed.payload)
 
     def _plan_select(self, payload: Dict[str, Any]) -> Operator:
         """
@@ -107,7 +107,7 @@ class Planner:
             op = Filter(op, predicate)
         
         # 如果不是SELECT *，添加投影算子
-        if columns != ["*"]:
+        if not is_select_star(columns):
             op = Project(op, columns)
         
         return op
@@ -125,10 +125,10 @@ class Planner:
             Operator: INSERT操作的执行计划
         """
         table = payload["table"]  # 表名
-        row = payload["row"]     # 要插入的行数据
+        rows = payload["rows"]   # 要插入的行数据（可能有多行）
         
         # 创建插入算子
-        return OpInsert(self.executor.catalog.get_table(table), [row])
+        return OpInsert(self.executor.catalog.get_table(table), rows)
 
     def _plan_create_table(self, payload: Dict[str, Any]) -> Operator:
         """
@@ -17,9 +17,15 @@
 
 from typing import Any, Dict, List, Optional, Tuple
 
-from .parser import Select as ASTSelect, Insert as ASTInsert, CreateTable as ASTCreate, Delete as ASTDelete, AST
+from .parser import Select as ASTSelect, Insert as ASTInsert, CreateTable as ASTCreate, Delete as ASTDelete, AST, is_select_star
 from execution.sytem_catalog import SystemCatalog
 
+# 列类型 -> 该列允许的Python值类型，INSERT类型检查时一次查表代替逐个类型分支
+_EXPECTED_PY_TYPE: Dict[str, type] = {
+    "INT": int,
+    "VARCHAR": str,
+}
+
 
 class SemanticError(Exception):
     """
@@ -44,6 +50,8 @@ class Analyzed:
     - kind: 操作类型（create_table, insert, select, delete）
     - payload: 操作的具体信息
     """
+    __slots__ = ("kind", "payload")
+
     def __init__(self, kind: str, payload: Dict[str, Any]) -> None:
         self.kind = kind      # 操作类型
         self.payload = payload  # 操作信息
@@ -56,6 +64,14 @@ class SemanticAnalyzer:
     负责对AST进行各种语义检查，确保SQL语句的语义正确性。
     """
     
+    # AST节点类型 -> 分析方法名，analyze() 据此分派
+    _ANALYZE_DISPATCH: Dict[type, str] = {
+        ASTCreate: "_analyze_create_table",
+        ASTInsert: "_analyze_insert",
+        ASTSelect: "_analyze_select",
+        ASTDelete: "_analyze_delete",
+    }
+    
     def __init__(self, catalog: SystemCatalog) -> None:
         """
         初始化语义分析器
@@ -78,6 +94,25 @@ class SemanticAnalyzer:
         if not self.catalog.table_exists(table):
             raise SemanticError(f"table '{table}' does not exist")
 
+    def _table_columns(self, table: str) -> Dict[str, str]:
+        """
+        检查表是否存在，并返回该表 列名 -> 类型 的字典
+        
+        字典是目录预先构建的列索引，每条语句只在入口处查询一次，
+        之后的列检查都在该字典上完成。
+        
+        参数:
+            table (str): 表名
+            
+        返回:
+            Dict[str, str]: 列名到类型的映射
+            
+        异常:
+            SemanticError: 当表不存在时抛出
+        """
+        self._ensure_table_exists(table)
+        return self.catalog.get_column_types(table)
+
     def analyze(self, ast: AST) -> Analyzed:
         """
         语义分析主函数
@@ -93,23 +128,11 @@ class SemanticAnalyzer:
         异常:
             SemanticError: 当发现语义错误时抛出
         """
-        # 处理CREATE TABLE语句
-        if isinstance(ast, ASTCreate):
-            return self._analyze_create_table(ast)
-        
-        # 处理INSERT语句
-        if isinstance(ast, ASTInsert):
-            return self._analyze_insert(ast)
-        
-        # 处理SELECT语句
-        if isinstance(ast, ASTSelect):
-            return self._analyze_select(ast)
-        
-        # 处理DELETE语句
-        if isinstance(ast, ASTDelete):
-            return self._analyze_delete(ast)
-        
-        raise SemanticError("unsupported AST")
+        # 按AST节点的确切类型查表分派，代替逐个 isinstance 判断
+        handler = self._ANALYZE_DISPATCH.get(type(ast))
+        if handler is None:
+            raise SemanticError("unsupported AST")
+        return getattr(self, handler)(ast)
 
     def _analyze_create_table(self, ast: ASTCreate) -> Analyzed:
         """
@@ -117,7 +140,8 @@ class SemanticAnalyzer:
         
         检查：
         1. 表是否已存在（重复创建检查）
-        2. 列类型是否支持
+        2. 列名是否重复
+        3. 列类型是否支持
         
         参数:
             ast (ASTCreate): CREATE TABLE的AST节点
@@ -126,12 +150,19 @@ class SemanticAnalyzer:
             Analyzed: 分析结果
             
         异常:
-            SemanticError: 当表已存在时抛出
+            SemanticError: 当表已存在或列名重复时抛出
         """
         # 检查表是否已存在
         if self.catalog.table_exists(ast.table):
             raise SemanticError(f"table '{ast.table}' already exists")
         
+        # 单次遍历检查重复列名（O(n)，不用 list.count 逐个统计）
+        seen = set()
+        for name, _ in ast.columns:
+            if name in seen:
+                raise SemanticError(f"duplicate column '{name}' in table '{ast.table}'")
+            seen.add(name)
+        
         # 类型合法性已在语法层初步保证，这里直接通过
         return Analyzed("create_table", {
             "table": ast.table,
@@ -157,42 +188,42 @@ class SemanticAnalyzer:
         异常:
             SemanticError: 当发现语义错误时抛出
         """
-        # 检查表是否存在
-        self._ensure_table_exists(ast.table)
-        
-        # 获取表的模式（列定义）
-        schema = self.catalog.get_schema(ast.table)
-        schema_cols = [c for c, _ in schema]  # 提取列名列表
+        # 检查表是否存在并获取 列名 -> 类型 的字典，列存在性检查和类型查找均为O(1)
+        col_types = self._table_columns(ast.table)
         
-        # 检查列数和值数是否匹配
-        if len(ast.columns) != len(ast.values):
-            raise SemanticError("columns and values length mismatch")
+        # 检查每一行的列数和值数是否匹配
+        ncols = len(ast.columns)
+        for values in ast.rows:
+            if len(values) != ncols:
+                raise SemanticError("columns and values length mismatch")
         
         # 检查列是否存在
         for c in ast.columns:
-            if c not in schema_cols:
+            if c not in col_types:
                 raise SemanticError(f"unknown column '{c}' for table '{ast.table}'")
         
+        # 每列的(列名, 类型, 期望的Python类型)只计算一次，多行插入时逐行复用；
+        # 未知类型的列期望类型为None，不做检查
+        columns = ast.columns
+        col_checks = []
+        for c in columns:
+            typ = col_types[c]  # 目录中的类型已统一为大写
+            col_checks.append((c, typ, _EXPECTED_PY_TYPE.get(typ)))
+        
         # 类型检查和数据准备
-        row: Dict[str, Any] = {}
-        for c, v in zip(ast.columns, ast.values):
-            # 获取列在模式中的索引
-            idx = schema_cols.index(c)
-            typ = schema[idx][1].upper()  # 获取列类型
-            
-            # 类型检查
-            if typ == "INT":
-                if not isinstance(v, int):
-                    raise SemanticError(f"column '{c}' expects INT, got {type(v).__name__}")
-            elif typ == "VARCHAR":
-                if not isinstance(v, str):
-                    raise SemanticError(f"column '{c}' expects VARCHAR, got {type(v).__name__}")
+        rows: List[Dict[str, Any]] = []
+        for values in ast.rows:
+            for (c, typ, py_type), v in zip(col_checks, values):
+                # 类型检查
+                if py_type is not None and not isinstance(v, py_type):
+                    raise SemanticError(f"column '{c}' expects {typ}, got {type(v).__name__}")
             
-            row[c] = v
+            # 整行一次性构造字典
+            rows.append(dict(zip(columns, values)))
         
         return Analyzed("insert", {
             "table": ast.table,
-            "row": row
+            "rows": rows
         })
 
     def _analyze_select(self, ast: ASTSelect) -> Analyzed:
@@ -213,25 +244,21 @@ class SemanticAnalyzer:
         异常:
             SemanticError: 当发现语义错误时抛出
         """
-        # 检查表是否存在
-        self._ensure_table_exists(ast.table)
-        
-        # 获取表的模式
-        schema = self.catalog.get_schema(ast.table)
-        schema_cols = [c for c, _ in schema]
+        # 检查表是否存在并获取 列名 -> 类型 的字典
+        col_types = self._table_columns(ast.table)
         
         # 检查列是否存在（如果不是SELECT *）
         cols = ast.columns
-        if cols != ["*"]:
+        if not is_select_star(cols):
             for c in cols:
-                if c not in schema_cols:
+                if c not in col_types:
                     raise SemanticError(f"unknown column '{c}' for table '{ast.table}'")
         
         # 检查WHERE子句
         where = None
         if ast.where is not None:
             col, op, val = ast.where
-            if col not in schema_cols:
+            if col not in col_types:
                 raise SemanticError(f"unknown column '{col}' in WHERE")
             where = (col, op, val)
         
@@ -258,15 +285,14 @@ class SemanticAnalyzer:
         异常:
             SemanticError: 当发现语义错误时抛出
         """
-        # 检查表是否存在
-        self._ensure_table_exists(ast.table)
+        # 检查表是否存在并获取 列名 -> 类型 的字典
+        col_types = self._table_columns(ast.table)
         
         # 检查WHERE子句
         where = None
         if ast.where is not None:
-            schema_cols = [c for c, _ in self.catalog.get_schema(ast.table)]
             col, op, val = ast.where
-            if col not in schema_cols:
+            if col not in col_types:
                 raise SemanticError(f"unknown column '{col}' in WHERE")
             where = (col, op, val)
         
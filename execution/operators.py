@@ -348,6 +348,18 @@ class Delete(Operator):
 
 # 辅助函数
 
+# 操作符 -> 谓词构造函数
+# 按操作符一次查表代替逐个比较；生成的谓词内联比较运算，每行只取一次列值
+_PREDICATE_BUILDERS: Dict[str, Callable[[str, Any], Callable[[Row], bool]]] = {
+    "EQ": lambda col, val: lambda r: r.get(col) == val,
+    "NE": lambda col, val: lambda r: r.get(col) != val,
+    "GT": lambda col, val: lambda r: (v := r.get(col)) is not None and v > val,
+    "LT": lambda col, val: lambda r: (v := r.get(col)) is not None and v < val,
+    "GE": lambda col, val: lambda r: (v := r.get(col)) is not None and v >= val,
+    "LE": lambda col, val: lambda r: (v := r.get(col)) is not None and v <= val,
+}
+
+
 def make_predicate(col: str, op: str, val: Any) -> Callable[[Row], bool]:
     """
     创建谓词函数
@@ -370,18 +382,8 @@ def make_predicate(col: str, op: str, val: Any) -> Callable[[Row], bool]:
         - GE: 大于等于
         - LE: 小于等于
     """
-    if op == "EQ":
-        return lambda r: r.get(col) == val
-    if op == "NE":
-        return lambda r: r.get(col) != val
-    if op == "GT":
-        return lambda r: (r.get(col) is not None) and (r.get(col) > val)
-    if op == "LT":
-        return lambda r: (r.get(col) is not None) and (r.get(col) < val)
-    if op == "GE":
-        return lambda r: (r.get(col) is not None) and (r.get(col) >= val)
-    if op == "LE":
-        return lambda r: (r.get(col) is not None) and (r.get(col) <= val)
-    
-    # 默认返回True（保留所有行）
-    return lambda r: True
+    build = _PREDICATE_BUILDERS.get(op)
+    if build is None:
+        # 默认返回True（保留所有行）
+        return lambda r: True
+    return build(col, val)
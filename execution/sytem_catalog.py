@@ -17,6 +17,7 @@
 - 创建表时自动更新目录信息
 """
 
+import sys
 from typing import Dict, List, Tuple
 
 from storage.buffer_manager import BufferManager
@@ -45,13 +46,14 @@ class SystemCatalog:
         功能:
             - 创建磁盘管理器和缓冲管理器
             - 初始化表对象缓存
-            - 初始化模式缓存
+            - 初始化模式缓存和列索引
             - 加载已存在的表结构
         """
         self.disk = DiskManager(db_path)           # 磁盘管理器
         self.buffer = BufferManager(self.disk)     # 缓冲管理器
         self.tables: Dict[str, Table] = {}         # 表对象缓存
         self.schemas: Dict[str, List[Tuple[str, str]]] = {}  # 模式缓存
+        self.column_types: Dict[str, Dict[str, str]] = {}   # 列索引：表名 -> {列名: 类型}
         
         # 初始化目录表
         cat = self.get_table(CATALOG_TABLE)
@@ -61,8 +63,9 @@ class SystemCatalog:
             tname = row.get("table")
             cols = row.get("columns") or []
             if isinstance(cols, list):
-                # 将列定义转换为(列名, 类型)元组列表
-                self.schemas[tname] = [(c[0], c[1]) for c in cols]
+                # 将列定义转换为(列名, 类型)元组列表，类型统一为驻留的大写形式
+                self.schemas[tname] = [(c[0], sys.intern(c[1].upper())) for c in cols]
+                self.column_types[tname] = dict(self.schemas[tname])
 
     def get_table(self, name: str) -> Table:
         """
@@ -98,8 +101,12 @@ class SystemCatalog:
         if name in self.schemas:
             raise ValueError(f"table {name} already exists")
         
-        # 注册模式到缓存
+        # 类型统一为驻留的大写形式，后续检查无需再调用upper()
+        columns = [(c, sys.intern(t.upper())) for c, t in columns]
+        
+        # 注册模式到缓存，同时建立列索引
         self.schemas[name] = columns
+        self.column_types[name] = dict(columns)
         
         # 写入目录表
         cat = self.get_table(CATALOG_TABLE)
@@ -128,3 +135,17 @@ class SystemCatalog:
             List[Tuple[str, str]]: 列定义列表，每个元组为(列名, 类型)
         """
         return self.schemas.get(name, [])
+
+    def get_column_types(self, name: str) -> Dict[str, str]:
+        """
+        获取表的列索引（列名 -> 类型）
+        
+        索引在加载目录和建表时预先构建，调用方只读，不应修改返回的字典。
+        
+        参数:
+            name (str): 表名
+            
+        返回:
+            Dict[str, str]: 列名到类型的映射，表不存在时返回空字典
+        """
+        return self.column_types.get(name, {})
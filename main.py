@@ -21,10 +21,11 @@ python main.py demo.db @script.sql --debug-pipeline --stats
 
 import sys
 import argparse
+import logging
 from typing import Any, Dict, List
 
-from compiler.lexer import tokenize
-from compiler.parser import Parser, Select, Insert, CreateTable, Delete
+from compiler.lexer import iter_tokens
+from compiler.parser import Select, Insert, CreateTable, Delete, parse_sql_cached
 from compiler.sematic_analyzer import SemanticAnalyzer, SemanticError, Analyzed
 from compiler.planner import Planner
 from execution.sytem_catalog import SystemCatalog
@@ -54,7 +55,8 @@ def ast_to_dict(ast: Any) -> Dict[str, Any]:
             "type": "Insert", 
             "table": ast.table, 
             "columns": ast.columns, 
-            "values": ast.values
+            "values": ast.values,
+            "rows": ast.rows
         }
     if isinstance(ast, CreateTable):
         return {
@@ -126,14 +128,12 @@ def run_sqls(db_file: str, sql: str, debug: bool = False, show_stats: bool = Fal
 
     # 词法分析
     if debug:
-        toks = tokenize(sql)
         print("[Tokens]")
-        for t in toks:
+        for t in iter_tokens(sql):
             print(t)
 
-    # 语法分析
-    parser = Parser(sql)
-    asts = parser.parse_many()
+    # 语法分析（相同SQL文本的重复执行直接命中解析缓存）
+    asts = parse_sql_cached(sql)
 
     if debug:
         print("[AST]")
@@ -183,6 +183,9 @@ def main() -> None:
                        help="print buffer manager stats")
     args = parser.parse_args()
 
+    # 命令行下照常输出缓冲逐出等INFO日志
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     db_file = args.db_file
     sql_arg = args.sql
     
@@ -17,12 +17,16 @@
 - 统计缓存命中、缺失和逐出次数
 """
 
+import logging
 from collections import OrderedDict
 from typing import Dict, Tuple
 
 from storage.disk_manager import DiskManager
 from storage.page import Page, PAGE_SIZE
 
+# 逐出日志：使用logging延迟格式化，日志级别未开启时不做任何字符串拼接
+logger = logging.getLogger(__name__)
+
 
 class BufferManager:
     """
@@ -52,13 +56,13 @@ class BufferManager:
         在需要时逐出页
         
         当缓存超过容量限制时，逐出最久未使用的页（LRU策略）。
-        逐出时会打印日志信息。
+        逐出时以INFO级别记录日志。
         """
         while len(self.cache) > self.capacity:
             # 逐出最久未使用的页（OrderedDict的第一个元素）
             pid, _ = self.cache.popitem(last=False)
             self.evictions += 1
-            print(f"[Buffer] Evict page {pid}")
+            logger.info("[Buffer] Evict page %d", pid)
 
     def get_page(self, page_id: int) -> Page:
         """
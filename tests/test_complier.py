@@ -4,7 +4,7 @@ import shutil
 import unittest
 
 from compiler.lexer import tokenize, LexError
-from compiler.parser import Parser, Select, Insert, CreateTable, Delete
+from compiler.parser import Parser, Select, Insert, CreateTable, Delete, parse_sql_cached
 from compiler.sematic_analyzer import SemanticAnalyzer, SemanticError
 from compiler.planner import Planner
 from execution.sytem_catalog import SystemCatalog
@@ -64,6 +64,14 @@ class TestCompilerLayer(unittest.TestCase):
         self.assertIsInstance(asts[2], Select)
         self.assertIsInstance(asts[3], Delete)
 
+    def test_parse_cache_reuses_ast(self):
+        sql = "SELECT id FROM s WHERE id = 1;"
+        first = parse_sql_cached(sql)
+        second = parse_sql_cached(sql)
+        self.assertIsNot(first, second)
+        self.assertIs(first[0], second[0])
+        self.assertEqual(first[0].where, ("id", "EQ", 1))
+
     def test_semantic_and_planner(self):
         # 创建表
         ast = Parser("CREATE TABLE s(id INT, name VARCHAR);").parse()
@@ -86,6 +94,11 @@ class TestCompilerLayer(unittest.TestCase):
             bad_q = Parser("SELECT foo FROM s;").parse()
             self.analyzer.analyze(bad_q)
 
+    def test_create_table_duplicate_column(self):
+        ast = Parser("CREATE TABLE d(id INT, name VARCHAR, id INT);").parse()
+        with self.assertRaises(SemanticError):
+            self.analyzer.analyze(ast)
+
 
 if __name__ == "__main__":
     unittest.main()
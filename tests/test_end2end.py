@@ -58,6 +58,16 @@ class TestEndToEnd(unittest.TestCase):
         self.assertIn('Bob', names)
         self.assertNotIn('Alice', names)
 
+    def test_multi_row_insert(self):
+        sql = """
+        CREATE TABLE t(id INT, name VARCHAR);
+        INSERT INTO t(id,name) VALUES (1,'a'), (2,'b'), (3,'c');
+        SELECT id FROM t WHERE id >= 2;
+        """
+        res = self._run_sqls(self.db_path, sql)
+        self.assertIn({'inserted': 3}, res)
+        self.assertEqual(res[-2:], [{'id': 2}, {'id': 3}])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -30,6 +30,7 @@ class TestExecutionLayer(unittest.TestCase):
         op_create = CreateTable(self.syscat, "t", [("id", "INT"), ("name", "VARCHAR")])
         res = self.executor.execute_plan(op_create)
         self.assertEqual(res[0]["created"], "t")
+        self.assertEqual(self.syscat.get_column_types("t"), {"id": "INT", "name": "VARCHAR"})
         # 2) 插入若干行
         rows = [{"id": i, "name": f"n{i}"} for i in range(5)]
         op_insert = Insert(self.syscat.get_table("t"), rows)